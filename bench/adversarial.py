@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+#coding=utf-8
+
+"""
+ME Analyzer Adversarial Corpus Generator
+Builds malformed images which push MEA into its worst-case analysis paths
+Pair with bench/run.py and the MEA -budget & -budget-mem per file limits
+"""
+
+import os
+import sys
+import ctypes
+import argparse
+
+from synth import mea, synth_image
+
+# Synthetic image shape of the cases which alter a valid image: size, Code Partitions, Modules per Partition, MFS size & files
+adv_image = (0x400000, 2, 16, 0x40000, 32)
+
+# Get a structure of the image, without the MEA get_struct input file bounds check
+def adv_struct(image, offset, class_name) :
+    return class_name.from_buffer_copy(bytes(image[offset:offset + ctypes.sizeof(class_name)]))
+
+# Get the $CPD offset & Manifest offset of a Code Partition
+def adv_partition(image, part_name) :
+    cpd_off = image.find(b'$CPD')
+
+    while cpd_off != -1 :
+        cpd_hdr_struct, cpd_hdr_size = mea.get_cpd(image, cpd_off)
+        cpd_hdr = adv_struct(image, cpd_off, cpd_hdr_struct)
+
+        if cpd_hdr.PartitionName == part_name.encode('utf-8') :
+            man_entry = adv_struct(image, cpd_off + cpd_hdr_size, mea.CPD_Entry)
+
+            return cpd_off, cpd_off + man_entry.get_flags()[0]
+
+        cpd_off = image.find(b'$CPD', cpd_off + 1)
+
+    sys.exit('Error: Code Partition %s not found!' % part_name)
+
+# Pad an altered synthetic image up to the requested size
+def adv_pad(image, image_size) :
+    return bytes(image) + b'\xFF' * max(image_size - len(image), 0)
+
+# FTPR Manifest Extensions of 8 bytes until the Manifest end, more than the 100 loops of the ext_anl safety valve
+def adv_ext_loop(seed, image_size) :
+    image = bytearray(synth_image(seed, *adv_image))
+
+    _, man_off = adv_partition(image, 'FTPR')
+
+    man_hdr = adv_struct(image, man_off, mea.MN2_Manifest_R2)
+    ext_start = man_off + man_hdr.HeaderLength * 4
+    ext_end = man_off + man_hdr.Size * 4
+
+    ext_data = (0x7F).to_bytes(4, 'little') + (0x8).to_bytes(4, 'little') # Unknown Extension 0x7F
+    image[ext_start:ext_end] = (ext_data * ((ext_end - ext_start) // 0x8 + 1))[:ext_end - ext_start]
+
+    return adv_pad(image, image_size)
+
+# $CPD Entry Count smaller than its Entries, followed by empty Entries which cpd_entry_num_fix retries over
+def adv_cpd_entries(seed, image_size) :
+    image = bytearray(synth_image(seed, *adv_image))
+
+    cpd_off, _ = adv_partition(image, 'NFTP')
+
+    cpd_hdr_struct, cpd_hdr_size = mea.get_cpd(image, cpd_off)
+    cpd_hdr = adv_struct(image, cpd_off, cpd_hdr_struct)
+    entry_size = ctypes.sizeof(mea.CPD_Entry)
+
+    image[cpd_off + 0x4:cpd_off + 0x8] = (1).to_bytes(4, 'little') # Manifest Entry only
+    image[cpd_off + cpd_hdr_size + entry_size:cpd_off + cpd_hdr_size + cpd_hdr.NumModules * entry_size] = b'\x00' * (cpd_hdr.NumModules - 1) * entry_size
+
+    return adv_pad(image, image_size)
+
+# Synthetic image without its CSE Layout Table, followed by a repeated pattern up to the requested size
+def adv_no_lt(seed, image_size, pattern) :
+    image = bytearray(synth_image(seed, *adv_image))
+
+    image[:0x1000] = b'\xFF' * 0x1000 # Whole image is searched for BPDT when no CSE Layout Table exists
+
+    return bytes(image) + (pattern * (max(image_size - len(image), 0) // len(pattern) + 1))[:max(image_size - len(image), 0)]
+
+# BPDT candidates which fail at the last byte of the last Entry, after all other Entry bytes were matched
+def adv_bpdt_scan(seed, image_size) :
+    bpdt_hdr = b'\xAA\x55\x00\x00\x06\x00\x02\x00' + bytes([seed & 0xFF]) * 0x10
+    bpdt_entry = b'\x02\x00\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00'
+
+    return adv_no_lt(seed, image_size, bpdt_hdr + bpdt_entry * 2 + bpdt_entry[:-1] + b'\x01')
+
+# Dense valid BPDT headers, each one is parsed with its Entries
+def adv_bpdt_many(seed, image_size) :
+    bpdt_hdr = b'\xAA\x55\x00\x00\x06\x00\x02\x00' + bytes([seed & 0xFF]) * 0x10
+    bpdt_entry = b'\x02\x00\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00'
+
+    bpdt_data = bpdt_hdr + bpdt_entry * 6
+
+    return adv_no_lt(seed, image_size, bpdt_data + b'\xFF' * (0x200 - len(bpdt_data)))
+
+# Dense $MN2 candidates without any Recovery Manifest, each one searches the previous 16KB three times
+def adv_man_scan(seed, image_size) :
+    man_data = b'\x86\x80' + bytes([seed & 0xFF]) * 0x9 + b'\x00$MN2'
+    man_data += b'\xFF' * (0x40 - len(man_data))
+
+    return (man_data * (image_size // len(man_data) + 1))[:image_size]
+
+# Adversarial Cases: Name --> (Generator, Targeted MEA path)
+adv_cases = {
+    'ext_loop' : (adv_ext_loop, 'ext_anl Extension loop_break > 100'),
+    'cpd_entries' : (adv_cpd_entries, 'cpd_entry_num_fix empty Entry retries'),
+    'bpdt_scan' : (adv_bpdt_scan, 'full image bpdt_pat.finditer near misses'),
+    'bpdt_many' : (adv_bpdt_many, 'full image bpdt_pat.finditer & BPDT parsing'),
+    'man_scan' : (adv_man_scan, 'man_pat.finditer & Recovery Manifest searches'),
+    }
+
+def main() :
+    parser = argparse.ArgumentParser(description='ME Analyzer Adversarial Corpus Generator')
+    parser.add_argument('output', help='output directory')
+    parser.add_argument('--cases', default=','.join(adv_cases), help='comma separated cases (default: %(default)s)')
+    parser.add_argument('--size', type=lambda x : int(x, 0), default=0x1000000, help='image size (default: 0x1000000)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed, same seed gives same images (default: %(default)s)')
+    args = parser.parse_args()
+
+    cases = [case.strip() for case in args.cases.split(',') if case.strip()]
+
+    for case in cases :
+        if case not in adv_cases : parser.error('unknown case "%s", choose from %s' % (case, ', '.join(adv_cases)))
+
+    os.makedirs(args.output, exist_ok=True)
+
+    for case in cases :
+        case_func, case_path = adv_cases[case]
+
+        image = case_func(args.seed, args.size)
+
+        out_path = os.path.join(args.output, 'adv_%s_%0.4d.bin' % (case, args.seed))
+
+        with open(out_path, 'wb') as out_file : out_file.write(image)
+
+        print('%s: 0x%X bytes, %s' % (out_path, len(image), case_path))
+
+    return 0
+
+if __name__ == '__main__' :
+    sys.exit(main())
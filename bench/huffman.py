@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+#coding=utf-8
+
+"""
+ME Analyzer Huffman Benchmark
+Encodes data into CSE Huffman chunked streams via the Huffman.dat mappings
+Measures cse_huffman_decompress throughput & guards it with round-trip checks
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import struct
+import argparse
+import functools
+import statistics
+
+from mea_defs import mea_defs, mea_path
+
+huffman_path = os.path.join(os.path.dirname(mea_path), 'Huffman.dat')
+
+huffman_chunk_size = 0x1000 # Huffman Chunk Uncompressed Length
+
+# Huffman Mapping types, same as MEA cse_huffman_dictionary_load
+huffman_types = {'code' : 0x20, 'data' : 0x60}
+
+# Firmware which loads each Huffman Dictionary version at MEA cse_huffman_dictionary_load
+huffman_fw = {11 : ('CSME', 11, 0), 12 : ('CSME', 12, 0)}
+
+# Get the Huffman encoding tables of a Dictionary version: Mapping type --> {symbol or symbol prefix: codeword bits or None}
+@functools.lru_cache(maxsize=None)
+def huffman_codewords(dict_version, dict_file=huffman_path) :
+    with open(dict_file, 'r', encoding='utf-8') as json_file : dict_mappings = json.load(json_file)[str(dict_version)]
+
+    codewords = {}
+
+    for mapping_name, mapping in dict_mappings.items() :
+        table = {}
+
+        for codeword, symbol in mapping.items() :
+            symbol = symbol.strip()
+
+            if not symbol or '??' in symbol : continue # Unknown symbols cannot be encoded
+
+            symbol = bytes.fromhex(symbol)
+
+            if table.get(symbol) is None or len(codeword) < len(table[symbol]) : table[symbol] = codeword
+
+            # Symbol prefixes are kept as None, so that the encoder knows when to stop looking for longer symbols
+            for prefix_len in range(1, len(symbol)) : table.setdefault(symbol[:prefix_len], None)
+
+        codewords[huffman_types[mapping_name]] = table
+
+    return codewords
+
+# Encode a Huffman Chunk with the fewest bits, symbols never cross the Chunk end
+def huffman_chunk(chunk, table) :
+    chunk_size = len(chunk)
+    cost = [0] * (chunk_size + 1)
+    step = [0] * (chunk_size + 1)
+
+    for pos in range(chunk_size - 1, -1, -1) :
+        best_cost = None
+
+        for sym_end in range(pos + 1, chunk_size + 1) :
+            codeword = table.get(chunk[pos:sym_end], False)
+
+            if codeword is False : break # Not a symbol or symbol prefix, no longer symbols exist
+
+            if codeword is not None and (best_cost is None or len(codeword) + cost[sym_end] < best_cost) :
+                best_cost = len(codeword) + cost[sym_end]
+                step[pos] = sym_end - pos
+
+        if best_cost is None : raise ValueError('Huffman byte 0x%0.2X cannot be encoded' % chunk[pos])
+
+        cost[pos] = best_cost
+
+    bits = []
+    pos = 0
+
+    while pos < chunk_size :
+        bits.append(table[chunk[pos:pos + step[pos]]])
+        pos += step[pos]
+
+    bits = ''.join(bits)
+    bits += '0' * (-len(bits) % 8) # Padding bits are never read, the Chunk ends at its Uncompressed Length
+
+    return int(bits, 2).to_bytes(len(bits) // 8, 'big') if bits else b''
+
+# Compress data to a CSE Huffman stream: Chunk Header (Offset 00:24, Dictionary 25:31) followed by the Chunks
+def huffman_compress(data, codewords) :
+    if len(data) % huffman_chunk_size : raise ValueError('Huffman data must be 0x%X aligned' % huffman_chunk_size)
+
+    header = []
+    stream = bytearray()
+
+    for chunk_start in range(0, len(data), huffman_chunk_size) :
+        chunk = bytes(data[chunk_start:chunk_start + huffman_chunk_size])
+        chunk_type, chunk_data = min(((dict_type, huffman_chunk(chunk, table)) for dict_type, table in codewords.items()), key=lambda x : len(x[1]))
+
+        header.append(len(stream) | chunk_type << 25)
+        stream += chunk_data
+
+    return struct.pack('<%dI' % len(header), *header) + bytes(stream)
+
+# Decompress a Huffman stream via MEA, get the data and whether the decompression had errors
+def huffman_decompress(mea, dict_version, comp_data, decomp_size) :
+    huff_shape, huff_sym, huff_unk = mea.cse_huffman_dictionary_load(*huffman_fw[dict_version], 'error')
+
+    return mea.cse_huffman_decompress(comp_data, len(comp_data), decomp_size, huff_shape, huff_sym, huff_unk, 'none')
+
+# Get the round-trip check inputs: uniform, random, firmware-like and Chunk boundary crossing data
+def huffman_cases(rng) :
+    from synth import synth_data # pylint: disable=C0415
+
+    return {
+        'zeros' : b'\x00' * huffman_chunk_size,
+        'ones' : b'\xFF' * huffman_chunk_size * 2,
+        'bytes' : bytes(range(0x100)) * (huffman_chunk_size // 0x100),
+        'random' : rng.randbytes(huffman_chunk_size * 3),
+        'synthetic' : synth_data(rng, huffman_chunk_size * 8),
+        'boundary' : (b'\x00' * (huffman_chunk_size - 0x8) + b'\xFF' * 0x10) * 2 + b'\xFF' * (huffman_chunk_size - 0x10),
+        }
+
+# Check that MEA decompresses each encoded case back to its input, get the failed cases
+def huffman_check(mea, dict_version, rng) :
+    failed = []
+
+    for case_name, case_data in huffman_cases(rng).items() :
+        decomp_data, huff_error = huffman_decompress(mea, dict_version, huffman_compress(case_data, huffman_codewords(dict_version)), len(case_data))
+
+        if huff_error or bytes(decomp_data) != case_data : failed.append(case_name)
+
+    return failed
+
+# Measure MEA Huffman decompression of the data with a Dictionary version, get the compressed size & run times
+def huffman_bench(mea, dict_version, data, repeat) :
+    comp_data = huffman_compress(data, huffman_codewords(dict_version))
+
+    run_times = []
+
+    for _ in range(repeat) :
+        run_start = time.perf_counter()
+        decomp_data, huff_error = huffman_decompress(mea, dict_version, comp_data, len(data))
+        run_times.append(time.perf_counter() - run_start)
+
+        if huff_error or bytes(decomp_data) != data : raise ValueError('Huffman %d round-trip mismatch' % dict_version)
+
+    return len(comp_data), run_times
+
+def main() :
+    parser = argparse.ArgumentParser(description='ME Analyzer Huffman Benchmark')
+    parser.add_argument('--dicts', default=','.join(str(dict_version) for dict_version in huffman_fw), help='comma separated Huffman Dictionary versions (default: %(default)s)')
+    parser.add_argument('--size', type=lambda x : int(x, 0), default=0x100000, help='uncompressed benchmark data size (default: 0x100000)')
+    parser.add_argument('--repeat', type=int, default=5, help='measured decompressions per Dictionary (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0, help='data generator seed (default: %(default)s)')
+    parser.add_argument('--check', action='store_true', help='only run the round-trip checks, non-zero exit on failure')
+    args = parser.parse_args()
+
+    dict_versions = [int(dict_version) for dict_version in args.dicts.split(',') if dict_version.strip()]
+
+    for dict_version in dict_versions :
+        if dict_version not in huffman_fw : parser.error('unknown Dictionary %d, choose from %s' % (dict_version, ', '.join(map(str, huffman_fw))))
+
+    if args.size <= 0 or args.size % huffman_chunk_size : parser.error('size must be a positive multiple of 0x%X' % huffman_chunk_size)
+
+    mea = mea_defs()
+
+    if args.check :
+        check_failed = False
+
+        for dict_version in dict_versions :
+            failed = huffman_check(mea, dict_version, random.Random(args.seed))
+            check_failed |= bool(failed)
+
+            print('Huffman %d: round-trip %s' % (dict_version, 'failed at %s' % ', '.join(failed) if failed else 'OK'))
+
+        return int(check_failed)
+
+    from synth import synth_data # pylint: disable=C0415
+
+    data = synth_data(random.Random(args.seed), args.size)
+
+    for dict_version in dict_versions :
+        comp_size, run_times = huffman_bench(mea, dict_version, data, args.repeat)
+        run_p50 = statistics.median(run_times)
+
+        print('Huffman %d: 0x%X --> 0x%X (%0.1f%%), p50 %0.3fs, min %0.3fs, %0.2f MB/s' % (dict_version, len(data), comp_size,
+              comp_size * 100 / len(data), run_p50, min(run_times), len(data) / 0x100000 / run_p50))
+
+    return 0
+
+if __name__ == '__main__' :
+    sys.exit(main())
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+#coding=utf-8
+
+"""
+ME Analyzer Definitions Loader
+Imports the MEA structures & functions without running the analysis
+Shared by the synthetic firmware generator and the micro-benchmarks
+"""
+
+import os
+import sys
+import functools
+import importlib.util
+
+mea_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'MEA_Core.py')
+
+# Import the MEA definitions (structures, functions, dictionaries) as a module, once per MEA_Core script
+@functools.lru_cache(maxsize=None)
+def mea_defs(mea_file=mea_path) :
+    mea_spec = importlib.util.spec_from_file_location('MEA_Core', mea_file)
+    mea = importlib.util.module_from_spec(mea_spec)
+
+    sys_argv = sys.argv
+    sys.argv = [mea_file, '-exit'] # MEA exits instead of waiting for input on errors
+    try :
+        mea_spec.loader.exec_module(mea)
+
+        # Globals of MEA main() which the definitions rely on
+        mea.param = mea.MEA_Param(sys.argv)
+        mea.mea_dir = os.path.dirname(os.path.abspath(mea_file))
+    finally :
+        sys.argv = sys_argv
+
+    return mea
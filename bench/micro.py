@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+#coding=utf-8
+
+"""
+ME Analyzer Micro Benchmark
+Measures the MEA parsing primitives in isolation over a synthetic image
+Reports ns/op, peak traced bytes/op & retained allocated blocks/op
+"""
+
+import gc
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+from mea_defs import mea_defs
+from synth import synth_image
+
+# Synthetic image shape: size, Code Partitions, Modules per Partition, MFS size & files
+micro_image = (0x400000, 2, 16, 0x40000, 32)
+
+# Get the realistic inputs of each primitive from a synthetic image
+def micro_inputs(mea, image) :
+    cse_lt = mea.get_struct(image, 0, mea.CSE_Layout_Table_17)
+
+    fpt_off = image.find(b'$FPT')
+    bpdt_off = cse_lt.BP1Offset
+    cpd_off = image.find(b'$CPD', bpdt_off)
+    mn2_off = image.find(b'$MN2', cpd_off) - 0x1C
+    mfs_off = image.find(b'\x87\x78\x55\xAA', fpt_off) # MFS Page Header Signature
+
+    cpd_hdr_struct, cpd_hdr_size = mea.get_cpd(image, cpd_off)
+    cpd_hdr = mea.get_struct(image, cpd_off, cpd_hdr_struct)
+    mn2_hdr = mea.get_struct(image, mn2_off, mea.get_manifest(image, mn2_off))
+    met_entry = mea.get_struct(image, cpd_off + cpd_hdr_size + 0x18, mea.CPD_Entry) # First Metadata, after the Manifest
+    met_off = cpd_off + met_entry.get_flags()[0]
+    mod_entry = mea.get_struct(image, cpd_off + cpd_hdr_size + 0x18 * 2, mea.CPD_Entry) # First Module, after its Metadata
+    mod_off = cpd_off + mod_entry.get_flags()[0]
+
+    return {
+        'cpd_off' : cpd_off,
+        'cpd_hdr' : cpd_hdr,
+        'cpd_hdr_size' : cpd_hdr_size,
+        'cpd_data' : image[cpd_off:cpd_off + cpd_hdr_size + cpd_hdr.NumModules * 0x18],
+        'mn2_off' : mn2_off,
+        'mn2_hdr' : mn2_hdr,
+        'fpt_off' : fpt_off,
+        'bpdt_off' : bpdt_off,
+        'met_data' : image[met_off:met_off + met_entry.Size],
+        'mod_data' : image[mod_off:mod_off + 0x10000],
+        'mfs_page_hdr' : image[mfs_off:mfs_off + 0x10],
+        'mfs_chunk' : image[mfs_off + 0x14:mfs_off + 0x14 + 0x42], # Chunk payload & index size
+        }
+
+# Get the benchmarked primitives: name --> callable without arguments
+def micro_cases(mea, image, inputs) :
+    crc = mea.crccheck.crc
+
+    return {
+        'get_struct CPD_Entry' : lambda : mea.get_struct(image, inputs['cpd_off'] + inputs['cpd_hdr_size'], mea.CPD_Entry),
+        'get_record CPD_Entry' : lambda : mea.get_record(image, inputs['cpd_off'] + inputs['cpd_hdr_size'], mea.CPD_Entry),
+        'get_records CPD_Entry x16' : lambda : mea.get_records(image, inputs['cpd_off'] + inputs['cpd_hdr_size'], mea.CPD_Entry, 16),
+        'get_struct MN2_Manifest_R2' : lambda : mea.get_struct(image, inputs['mn2_off'], mea.MN2_Manifest_R2),
+        'get_manifest' : lambda : mea.get_manifest(image, inputs['mn2_off']),
+        'get_cpd' : lambda : mea.get_cpd(image, inputs['cpd_off']),
+        'get_fpt' : lambda : mea.get_fpt(image, inputs['fpt_off']),
+        'get_bpdt' : lambda : mea.get_bpdt(image, inputs['bpdt_off']),
+        'cpd_entry_num_fix' : lambda : mea.cpd_entry_num_fix(image, inputs['cpd_off'], inputs['cpd_hdr'].NumModules, inputs['cpd_hdr_size']),
+        'get_cpd_dir' : lambda : (mea.anl_cache.clear(), mea.get_cpd_dir(image, inputs['cpd_off'])),
+        'get_cpd_dir cached' : lambda : mea.get_cpd_dir(image, inputs['cpd_off']),
+        'cpd_size_calc' : lambda : (mea.anl_cache.clear(), mea.cpd_size_calc(image, inputs['cpd_off'], 0x1000)),
+        'cse_part_inid' : lambda : (mea.anl_cache.clear(), mea.cse_part_inid(image, inputs['cpd_off'], mea.ext_dict)),
+        'struct_json MN2_Manifest_R2' : lambda : mea.struct_json(inputs['mn2_hdr']),
+        'get_hash SHA-256 Metadata' : lambda : mea.get_hash(inputs['met_data'], 0x20),
+        'get_hash SHA-384 Module 64KB' : lambda : mea.get_hash(inputs['mod_data'], 0x30),
+        'rsa_sig_val RSA-3072' : lambda : mea.rsa_sig_val(inputs['mn2_hdr'], image, inputs['mn2_off']),
+        'Crc16_14' : lambda : mea.Crc16_14(0x1234),
+        'Crc8 MFS Page Header' : lambda : crc.Crc8.calc(inputs['mfs_page_hdr'], initvalue=1),
+        'Crc16 MFS Chunk' : lambda : crc.Crc16.calc(inputs['mfs_chunk'], initvalue=0xFFFF),
+        'Crc32 $CPD Header' : lambda : crc.Crc32.calc(inputs['cpd_data']),
+        }
+
+# Get the loop count which runs for at least min_time seconds
+def micro_loops(func, min_time) :
+    loops = 1
+
+    while True :
+        run_start = time.perf_counter()
+        for _ in range(loops) : func()
+        if time.perf_counter() - run_start >= min_time : return loops
+        loops *= 2
+
+# Measure a primitive: best ns/op of all repetitions, peak traced bytes/op & retained allocated blocks/op
+def micro_bench(func, min_time, repeat) :
+    loops = micro_loops(func, min_time)
+
+    run_times = []
+    for _ in range(repeat) :
+        run_start = time.perf_counter_ns()
+        for _ in range(loops) : func()
+        run_times.append((time.perf_counter_ns() - run_start) / loops)
+
+    alloc_loops = min(loops, 1000)
+
+    tracemalloc.start()
+    func() # Warm up any lazily created objects
+    tracemalloc.reset_peak()
+    trace_base = tracemalloc.get_traced_memory()[0]
+    func()
+    peak_bytes = tracemalloc.get_traced_memory()[1] - trace_base
+    tracemalloc.stop()
+
+    gc.collect()
+    blocks_base = sys.getallocatedblocks()
+    for _ in range(alloc_loops) : func()
+    gc.collect()
+    blocks = (sys.getallocatedblocks() - blocks_base) / alloc_loops
+
+    return {'ns/op' : round(min(run_times), 1), 'Peak B/op' : peak_bytes, 'Blocks/op' : round(blocks, 3), 'Loops' : loops}
+
+def main() :
+    parser = argparse.ArgumentParser(description='ME Analyzer Micro Benchmark')
+    parser.add_argument('--filter', default='', help='only run primitives whose name contains this text')
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimum seconds per measured repetition (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5, help='measured repetitions per primitive (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0, help='synthetic image seed (default: %(default)s)')
+    parser.add_argument('--save', help='store the results as JSON')
+    args = parser.parse_args()
+
+    mea = mea_defs()
+
+    image = synth_image(args.seed, *micro_image)
+
+    # Globals of the main body which the primitives rely on
+    mea.reading = image
+    mea.file_end = len(image)
+    mea.err_stor, mea.warn_stor, mea.note_stor = [], [], []
+
+    cases = {name: func for name, func in micro_cases(mea, image, micro_inputs(mea, image)).items() if args.filter.lower() in name.lower()}
+
+    if not cases : parser.error('no primitive matches "%s"' % args.filter)
+
+    results = {}
+
+    print('%-30s %14s %12s %10s' % ('Primitive', 'ns/op', 'Peak B/op', 'Blocks/op'))
+
+    for name, func in cases.items() :
+        results[name] = micro_bench(func, args.min_time, args.repeat)
+
+        print('%-30s %14.1f %12d %10.3f' % (name, results[name]['ns/op'], results[name]['Peak B/op'], results[name]['Blocks/op']))
+
+    if mea.err_stor : print('\nPrimitive errors:\n\n%s' % '\n'.join(error[0] for error in mea.err_stor))
+
+    if args.save :
+        with open(args.save, 'w', encoding='utf-8') as save_file : json.dump(results, save_file, indent=4)
+
+    return 0
+
+if __name__ == '__main__' :
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+#coding=utf-8
+
+"""
+ME Analyzer Corpus Benchmark
+Runs MEA over a firmware corpus at various modes
+Compares the results against a stored baseline
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+mea_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'MEA.py')
+
+# Benchmark Modes: MEA parameters, whether each run needs its own corpus copy (-dbn renames input files) & whether it runs by default
+# Only the prof Mode has per file & per phase times (-prof -json reports), the others measure their run time without that overhead
+# The unp86 Mode needs FileTable.dat, which is not shipped, for each MFS with a File Table, so it runs only on demand
+bench_modes = {
+    'plain' : ([], False, True),
+    'json'  : (['-json'], False, True),
+    'prof'  : (['-prof', '-json'], False, True),
+    'dbn'   : (['-dbn'], True, True),
+    'unp86' : (['-unp86'], False, False),
+    }
+
+# Get the p-th percentile of values, linear interpolation between closest ranks
+def percentile(values, p) :
+    if not values : return 0.0
+
+    values = sorted(values)
+    rank = (len(values) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+# Get all corpus files and their total size
+def corpus_files(corpus_dir) :
+    files = []
+
+    for root, _, names in os.walk(corpus_dir) :
+        for name in names : files.append(os.path.join(root, name))
+
+    return sorted(files), sum(os.path.getsize(path) for path in files)
+
+# Run MEA once over the corpus, get the total wall time and the per file -prof phases from the -json reports (prof Mode)
+def mea_run(mode, corpus_dir, mea_file) :
+    mode_params, mode_copy, _ = bench_modes[mode]
+
+    with tempfile.TemporaryDirectory() as temp_dir :
+        out_dir = os.path.join(temp_dir, 'out')
+        run_dir = os.path.join(temp_dir, 'corpus') if mode_copy else corpus_dir
+
+        os.mkdir(out_dir)
+
+        if mode_copy : shutil.copytree(corpus_dir, run_dir)
+
+        run_params = [sys.executable, mea_file, '-mass', run_dir, '-skip', '-exit', '-duc', '-dcm', '-out', out_dir] + mode_params
+
+        run_start = time.perf_counter()
+        run_proc = subprocess.run(run_params, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False)
+        run_time = time.perf_counter() - run_start
+
+        if run_proc.returncode != 0 :
+            sys.exit('Error: MEA %s run failed!\n\n%s' % (mode, run_proc.stderr.decode('utf-8', 'ignore')))
+
+        file_phases = {}
+
+        if '-prof' not in mode_params : return run_time, file_phases
+
+        for json_name in os.listdir(out_dir) :
+            if not json_name.endswith('.json') or json_name == 'MEA_Profile.json' : continue
+
+            with open(os.path.join(out_dir, json_name), 'r', encoding='utf-8') as json_file : json_data = json.load(json_file)
+
+            for file_path, file_info in json_data.items() :
+                if isinstance(file_info, dict) and 'Profile' in file_info :
+                    file_phases[os.path.relpath(file_path, run_dir)] = {name: stat['Wall'] for name, stat in file_info['Profile'].items()}
+
+        return run_time, file_phases
+
+# Run a benchmark Mode with warmup & repetitions, get its percentiles & throughput
+def bench_mode(mode, corpus_dir, mea_file, file_count, file_size, warmup, repeat) :
+    for _ in range(warmup) : mea_run(mode, corpus_dir, mea_file)
+
+    run_times = []
+    file_times = {}
+    phase_times = {}
+
+    for _ in range(repeat) :
+        run_time, file_phases = mea_run(mode, corpus_dir, mea_file)
+
+        run_times.append(run_time)
+
+        for file_path, phases in file_phases.items() :
+            file_times.setdefault(file_path, []).append(phases.get('Total', 0.0))
+
+            for name, wall in phases.items() : phase_times.setdefault(name, []).append(wall)
+
+    run_p50 = percentile(run_times, 50)
+
+    return {
+        'Runs' : [round(run_time, 6) for run_time in run_times],
+        'Run p50' : round(run_p50, 6),
+        'Run p95' : round(percentile(run_times, 95), 6),
+        'Files/s' : round(file_count / run_p50, 3) if run_p50 else 0.0,
+        'MB/s' : round(file_size / 0x100000 / run_p50, 3) if run_p50 else 0.0,
+        'Files' : {path: {'p50': round(percentile(times, 50), 6), 'p95': round(percentile(times, 95), 6)} for path, times in sorted(file_times.items())},
+        'Phases' : {name: {'p50': round(percentile(times, 50), 6), 'p95': round(percentile(times, 95), 6)} for name, times in sorted(phase_times.items())},
+        }
+
+# Compare results against a baseline, get all regressions above both the relative tolerance & the minimum absolute slowdown
+# The minimum slowdown keeps sub-millisecond file & phase times from failing on timer noise
+def bench_compare(results, baseline, tolerance, min_delta) :
+    regressions = []
+
+    for mode, result in results.items() :
+        if mode not in baseline : continue
+
+        base = baseline[mode]
+
+        checks = [('Run p50', base.get('Run p50'), result['Run p50'])]
+        checks += [('File %s p50' % path, base.get('Files', {}).get(path, {}).get('p50'), stat['p50']) for path, stat in result['Files'].items()]
+        checks += [('Phase %s p50' % name, base.get('Phases', {}).get(name, {}).get('p50'), stat['p50']) for name, stat in result['Phases'].items()]
+
+        for name, base_time, new_time in checks :
+            if base_time and new_time > base_time * (1 + tolerance) and new_time - base_time > min_delta :
+                regressions.append('%s > %s: %0.4fs --> %0.4fs (+%0.1f%%)' % (mode, name, base_time, new_time, (new_time / base_time - 1) * 100))
+
+    return regressions
+
+def main() :
+    parser = argparse.ArgumentParser(description='ME Analyzer Corpus Benchmark')
+    parser.add_argument('corpus', help='directory of firmware images')
+    parser.add_argument('--mea', default=mea_path, help='MEA script to benchmark (default: %(default)s)')
+    parser.add_argument('--modes', default=','.join(mode for mode, (_, _, default) in bench_modes.items() if default),
+                        help='comma separated modes, from %s (default: %%(default)s)' % ', '.join(bench_modes))
+    parser.add_argument('--warmup', type=int, default=1, help='warmup runs per mode (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3, help='measured runs per mode (default: %(default)s)')
+    parser.add_argument('--baseline', help='baseline JSON to compare against, non-zero exit on regression')
+    parser.add_argument('--tolerance', type=float, default=0.10, help='allowed slowdown over the baseline (default: %(default)s)')
+    parser.add_argument('--min-delta', type=float, default=0.005, help='allowed slowdown over the baseline in seconds, '
+                        'also needed for a regression (default: %(default)s)')
+    parser.add_argument('--save', help='store the results as a baseline JSON')
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+
+    for mode in modes :
+        if mode not in bench_modes : parser.error('unknown mode "%s", choose from %s' % (mode, ', '.join(bench_modes)))
+
+    if 'unp86' in modes and not os.path.isfile(os.path.join(os.path.dirname(os.path.abspath(args.mea)), 'FileTable.dat')) :
+        parser.error('mode "unp86" needs FileTable.dat next to %s' % args.mea)
+
+    args.corpus = os.path.abspath(args.corpus)
+
+    files, file_size = corpus_files(args.corpus)
+
+    if not files : parser.error('corpus "%s" has no files' % args.corpus)
+
+    print('Corpus: %d file(s), %0.2f MB' % (len(files), file_size / 0x100000))
+
+    results = {}
+
+    for mode in modes :
+        results[mode] = bench_mode(mode, args.corpus, args.mea, len(files), file_size, args.warmup, args.repeat)
+
+        print('%-6s: p50 %0.3fs, p95 %0.3fs, %0.2f files/s, %0.2f MB/s%s' % (mode, results[mode]['Run p50'], results[mode]['Run p95'],
+              results[mode]['Files/s'], results[mode]['MB/s'], '' if '-prof' in bench_modes[mode][0] else ', whole run only (per file & phase at prof)'))
+
+    if args.save :
+        with open(args.save, 'w', encoding='utf-8') as save_file : json.dump(results, save_file, indent=4)
+
+    if args.baseline :
+        with open(args.baseline, 'r', encoding='utf-8') as base_file : baseline = json.load(base_file)
+
+        regressions = bench_compare(results, baseline, args.tolerance, args.min_delta)
+
+        if regressions :
+            print('\nRegressions over %0.0f%% & %0.3fs tolerance:\n\n%s' % (args.tolerance * 100, args.min_delta, '\n'.join(regressions)))
+
+            return 1
+
+        print('\nNo regressions over %0.0f%% & %0.3fs tolerance' % (args.tolerance * 100, args.min_delta))
+
+    return 0
+
+if __name__ == '__main__' :
+    sys.exit(main())
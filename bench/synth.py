@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+#coding=utf-8
+
+"""
+ME Analyzer Synthetic Firmware Generator
+Builds deterministic CSME 15 IFWI 1.7 images from the MEA structures
+Covers the $FPT, BPDT, $CPD, $MN2, Extension, LZMA, Huffman & MFS analysis paths
+"""
+
+import os
+import sys
+import lzma
+import random
+import ctypes
+import hashlib
+import argparse
+
+from mea_defs import mea_defs
+from huffman import huffman_codewords, huffman_compress, huffman_chunk_size
+
+mea = mea_defs()
+
+# Synthetic firmware version, the RSA Public Key is not at the DB so the Variant is detected via FTPR > fwupdate
+synth_ver = (15, 0, 35, 1951)
+synth_meu = (15, 0, 35, 1951)
+synth_date = (0x15, 0x01, 0x2022) # BCD Day, Month, Year
+
+# BPDT Types & Names of the additional Code Partitions, in order of use
+synth_parts = [(7,'NFTP'), (8,'ISHC'), (15,'IUNP'), (41,'SAMF'), (45,'PSEP'), (43,'GBST'), (44,'TCCP')]
+
+# FTPR Modules which are always present (FTPR > fwupdate detects the CSME Variant)
+synth_ftpr_mods = ['rbe', 'kernel', 'syslib', 'bup', 'fwupdate']
+
+# Intel LZMA Module Header: lc 0, lp 1, pb 1, 16KB Dictionary (0x36, 0x4000)
+lzma_filters = [{'id': lzma.FILTER_LZMA1, 'dict_size': 0x4000, 'lc': 0, 'lp': 1, 'pb': 1}]
+
+mfs_page_size = 0x2000 # MFS Page Length
+mfs_chunk_size = 0x40 # MFS Chunk Payload Length
+mfs_chunks_sys = (mfs_page_size - 0x12 - 0x2) // (0x2 + 0x42) # MFS System Page Chunks Count
+mfs_chunks_dat = (mfs_page_size - 0x12) // (0x1 + 0x42) # MFS Data Page Chunks Count
+mfs_file_recs = 0x200 # MFS Volume File Records Count
+
+# Align size to the next multiple of alignment
+def align_up(size, alignment) :
+    return size + (-size % alignment)
+
+# Get the bytes of a ctypes Structure after filling its fields
+def struct_bytes(struct_class, *struct_args, **fields) :
+    struct_obj = struct_class(*struct_args)
+
+    for name, value in fields.items() :
+        if isinstance(value, bytes) and not isinstance(getattr(struct_obj, name), bytes) :
+            ctypes.memmove(ctypes.addressof(struct_obj) + getattr(struct_class, name).offset, value, getattr(struct_class, name).size)
+        else :
+            setattr(struct_obj, name, value)
+
+    return bytes(struct_obj)
+
+# Generate compressible Module contents, a skewed mix of fixed "instructions" & random data
+def synth_data(rng, size) :
+    words = [rng.randbytes(0x10) for _ in range(0x100)]
+    weights = [1 / (index + 1) for index in range(len(words))]
+
+    data = b''.join(rng.choices(words, weights, k=-(-size // 0x10)))
+
+    return data[:size]
+
+# Check if number is a probable prime (Miller-Rabin)
+def is_prime(number, rng, rounds=16) :
+    for prime in (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47) :
+        if number % prime == 0 : return number == prime
+
+    odd, twos = number - 1, 0
+    while odd % 2 == 0 : odd, twos = odd // 2, twos + 1
+
+    for _ in range(rounds) :
+        x = pow(rng.randrange(2, number - 1), odd, number)
+        if x in (1, number - 1) : continue
+
+        for _ in range(twos - 1) :
+            x = pow(x, 2, number)
+            if x == number - 1 : break
+        else :
+            return False
+
+    return True
+
+# Generate a deterministic RSA 3072-bit key (modulus, private exponent)
+def rsa_key(rng, exponent=0x10001) :
+    primes = []
+
+    while len(primes) < 2 :
+        candidate = rng.getrandbits(1536) | (3 << 1534) | 1 # Top two bits set so that the modulus is 3072-bit
+        if candidate % exponent != 1 and is_prime(candidate, rng) : primes.append(candidate)
+
+    modulus = primes[0] * primes[1]
+
+    return modulus, pow(exponent, -1, (primes[0] - 1) * (primes[1] - 1))
+
+# Sign message via RSA SSA-PSS with SHA-384 (reverse of MEA pss_verify)
+def rsa_sign_pss(message, key, rng, sign_len=0x180) :
+    modulus, private = key
+    salt = rng.randbytes(0x30)
+
+    m_hash = hashlib.sha384(b'\x00' * 8 + hashlib.sha384(message).digest() + salt).digest()
+    db = b'\x00' * (sign_len - len(salt) - len(m_hash) - 2) + b'\x01' + salt
+    masked_db = bytearray(a ^ b for a, b in zip(db, mea.pss_mgf(m_hash, len(db), hashlib.sha384)))
+    masked_db[0] &= 0x7F # Encoded Message must be smaller than the Modulus
+
+    return pow(int.from_bytes(bytes(masked_db) + m_hash + b'\xBC', 'big'), private, modulus)
+
+# Build CSE LZMA Module, Intel adds three zeros after the LZMA Header
+def lzma_module(data) :
+    comp_data = lzma.compress(data, format=lzma.FORMAT_ALONE, filters=lzma_filters)
+    comp_data = comp_data[:0x5] + len(data).to_bytes(8, 'little') + comp_data[0xD:]
+
+    return comp_data[:0xE] + b'\x00' * 3 + comp_data[0xE:]
+
+# Build CSE Manifest ($MN2) with its Extensions, RSA Signature is added last via manifest_sign
+def manifest_build(ext_data, key, build_tag) :
+    hdr_size = ctypes.sizeof(mea.MN2_Manifest_R2)
+
+    return bytearray(struct_bytes(mea.MN2_Manifest_R2, HeaderType=4, HeaderLength=hdr_size // 4, HeaderVersion=0x21000,
+                     VEN_ID=0x8086, Day=synth_date[0], Month=synth_date[1], Year=synth_date[2], Size=(hdr_size + len(ext_data)) // 4,
+                     Tag=b'$MN2', BuildTag=build_tag, Major=synth_ver[0], Minor=synth_ver[1], Hotfix=synth_ver[2], Build=synth_ver[3],
+                     SVN=1, MEU_Major=synth_meu[0], MEU_Minor=synth_meu[1], MEU_Hotfix=synth_meu[2], MEU_Build=synth_meu[3],
+                     Flags=1, MEU_Man_Ver=1, PublicKeySize=0x60, ExponentSize=1, RSAPublicKey=key[0].to_bytes(0x180, 'little'),
+                     RSAExponent=0x10001) + ext_data)
+
+# Sign CSE Manifest, first 0x80 bytes and Extensions (same data as MEA rsa_sig_val)
+def manifest_sign(man_data, key, rng) :
+    hdr_size = ctypes.sizeof(mea.MN2_Manifest_R2)
+    sign_off = mea.MN2_Manifest_R2.RSASignature.offset
+
+    man_data[sign_off:sign_off + 0x180] = rsa_sign_pss(bytes(man_data[:0x80] + man_data[hdr_size:]), key, rng).to_bytes(0x180, 'little')
+
+# Build $CPD Code Partition with Manifest, Metadata & LZMA/Uncompressed Modules
+def cpd_partition(part_name, mod_names, mod_size, key, rng, compress) :
+    cpd_hdr_size = ctypes.sizeof(mea.CPD_Header_R2)
+    cpd_entry_size = ctypes.sizeof(mea.CPD_Entry)
+    man_name = part_name + '.man'
+
+    mods = []
+    for mod_index, mod_name in enumerate(mod_names) :
+        if not compress or mod_index % 4 == 3 : mod_comp = 0 # Every 4th Module stays Uncompressed
+        elif mod_index % 4 == 1 : mod_comp = 1 # Every 4th Module is Huffman compressed
+        else : mod_comp = 2 # All other Modules are LZMA compressed
+
+        mod_data = synth_data(rng, rng.randrange(mod_size // 2, mod_size * 3 // 2) & ~0xF)
+
+        if mod_comp == 1 :
+            mod_data += bytes(align_up(len(mod_data), huffman_chunk_size) - len(mod_data)) # Huffman data is Chunk aligned
+            mod_raw = huffman_compress(mod_data, huffman_codewords(mea.cse_huffman_dictionary_ver('CSME', synth_ver[0], synth_ver[1])))
+        elif mod_comp == 2 :
+            mod_raw = lzma_module(mod_data)
+        else :
+            mod_raw = mod_data
+
+        # Metadata Hash is of the Uncompressed data for Huffman but of the Compressed data for LZMA
+        met_data = struct_bytes(mea.CSE_Ext_0A_R2, Tag=0xA, Size=ctypes.sizeof(mea.CSE_Ext_0A_R2), Compression=mod_comp,
+                                SizeUncomp=len(mod_data), SizeComp=len(mod_raw), DEV_ID=0, VEN_ID=0x8086,
+                                Hash=hashlib.sha384(mod_data if mod_comp == 1 else mod_raw).digest()[::-1])
+
+        mods.append((mod_name, mod_comp, mod_data, mod_raw, met_data))
+
+    ext_03_mods = b''.join(struct_bytes(mea.CSE_Ext_03_Mod, Name=mod[0].encode('utf-8'), Type=0, Compression=mod[1], Reserved=0xFFFF,
+                           MetadataSize=len(mod[4]), MetadataHash=hashlib.sha256(mod[4]).digest()[::-1]) for mod in mods)
+    ext_03_size = ctypes.sizeof(mea.CSE_Ext_03_R2) + len(ext_03_mods)
+    ext_0c_data = struct_bytes(mea.CSE_Ext_0C, 'CSME', *synth_ver, synth_date[2], synth_date[1], 'CSME', Tag=0xC, Size=ctypes.sizeof(mea.CSE_Ext_0C),
+                               FWSKUCapsRes=b'\xFF' * 0x1C) if part_name == 'FTPR' else b''
+
+    # Entries: Manifest, then each Module Metadata & Module
+    entries = [(man_name, None, 0, 0)]
+    for mod in mods : entries += [(mod[0] + '.met', mod[4], 0, 0), (mod[0], mod[3], len(mod[2]), int(mod[1] == 1))]
+
+    man_off = align_up(cpd_hdr_size + len(entries) * cpd_entry_size, 0x10)
+    man_size = ctypes.sizeof(mea.MN2_Manifest_R2) + ext_03_size + len(ext_0c_data)
+
+    entry_data = b''
+    data_off = align_up(man_off + man_size, 0x80)
+    data_all = bytearray()
+    for entry_name, entry_raw, entry_uncomp, entry_huff in entries :
+        if entry_raw is None :
+            entry_off, entry_size = man_off, man_size
+        else :
+            entry_off, entry_size = data_off, entry_uncomp or len(entry_raw) # $CPD Entry Size is Uncompressed for LZMA & Huffman
+            data_all += entry_raw + b'\xFF' * (align_up(len(entry_raw), 0x80) - len(entry_raw))
+            data_off = align_up(data_off + len(entry_raw), 0x80)
+
+        entry_data += struct_bytes(mea.CPD_Entry, Name=entry_name.encode('utf-8'), OffsetAttrib=entry_off | entry_huff << 25, Size=entry_size)
+
+    cpd_hdr = bytearray(struct_bytes(mea.CPD_Header_R2, Tag=b'$CPD', NumModules=len(entries), HeaderVersion=2, EntryVersion=1,
+                        HeaderLength=cpd_hdr_size, PartitionName=part_name.encode('utf-8')))
+    cpd_hdr[0x10:0x14] = mea.crccheck.crc.Crc32.calc(cpd_hdr + entry_data).to_bytes(4, 'little')
+
+    part_data = bytearray(cpd_hdr + entry_data)
+    part_data += b'\x00' * (man_off - len(part_data)) + b'\x00' * man_size
+    part_data += b'\x00' * (align_up(man_off + man_size, 0x80) - len(part_data)) + data_all
+    part_data += b'\xFF' * (align_up(len(part_data), 0x1000) - len(part_data))
+
+    # Partition Hash covers everything except the Manifest, which holds the Hash (CSE Hashes are stored byte reversed)
+    part_hash = hashlib.sha384(part_data[:man_off] + part_data[man_off + man_size:]).digest()[::-1]
+
+    ext_03_data = struct_bytes(mea.CSE_Ext_03_R2, Tag=0x3, Size=ext_03_size, PartitionName=part_name.encode('utf-8'),
+                               PartitionSize=len(part_data), Hash=part_hash, VCN=1, PartitionVerMin=synth_ver[1],
+                               PartitionVerMaj=synth_ver[0], DataFormatMinor=0, DataFormatMajor=1, InstanceID=0, Flags=0, Unknown=3)
+
+    man_data = manifest_build(ext_03_data + ext_03_mods + ext_0c_data, key, rng.getrandbits(32))
+    manifest_sign(man_data, key, rng)
+
+    part_data[man_off:man_off + man_size] = man_data
+
+    return bytes(part_data)
+
+# Build MFS System Page with obfuscated Chunk Indexes
+def mfs_sys_page(page_number, chunks) :
+    index_data = b''
+    chunk_data = b''
+    index_last = 0
+
+    for chunk_index, chunk_raw in chunks :
+        index_data += (mea.Crc16_14(index_last) ^ chunk_index).to_bytes(2, 'little')
+        chunk_data += chunk_raw + mfs_chunk_crc(chunk_raw, chunk_index)
+        index_last = chunk_index
+
+    index_data += b'\xFF\xFF' * (mfs_chunks_sys + 1 - len(chunks))
+
+    page_data = mfs_page_hdr(page_number, 0) + index_data + chunk_data
+
+    return page_data + b'\xFF' * (mfs_page_size - len(page_data))
+
+# Build MFS Data Page, all its Chunks are used
+def mfs_dat_page(page_number, chunk_first, chunks) :
+    page_data = mfs_page_hdr(page_number, chunk_first) + b'\x00' * mfs_chunks_dat
+
+    for chunk_offset, chunk_raw in enumerate(chunks) : page_data += chunk_raw + mfs_chunk_crc(chunk_raw, chunk_first + chunk_offset)
+
+    return page_data + b'\xFF' * (mfs_page_size - len(page_data))
+
+# Build MFS Page Header with its CRC-8
+def mfs_page_hdr(page_number, chunk_first) :
+    page_hdr = bytearray(struct_bytes(mea.MFS_Page_Header, Signature=0xAA557887, PageNumber=page_number, EraseCount=1,
+                                      NextErasePage=0, FirstChunkIndex=chunk_first))
+    page_hdr[0x10] = mea.crccheck.crc.Crc8.calc(page_hdr[:0x10], initvalue=1)
+
+    return bytes(page_hdr)
+
+# Get MFS Chunk CRC-16, it includes the Chunk Index
+def mfs_chunk_crc(chunk_raw, chunk_index) :
+    return mea.crccheck.crc.Crc16.calc(chunk_raw + chunk_index.to_bytes(2, 'little'), initvalue=0xFFFF).to_bytes(2, 'little')
+
+# Build MFS partition with System Volume, FAT & Files which fill its Data Pages
+def mfs_partition(mfs_size, file_count, rng) :
+    page_count = mfs_size // mfs_page_size
+    sys_count = page_count // 12
+    dat_count = page_count - sys_count - 1
+    dat_chunks = dat_count * mfs_chunks_dat
+    fat_count = mfs_file_recs + dat_chunks
+    sys_chunks = -(-(0xE + fat_count * 2) // mfs_chunk_size)
+
+    if sys_chunks > sys_count * mfs_chunks_sys : sys.exit('Error: MFS size 0x%X is too small!' % mfs_size)
+
+    # Spread the Data Chunks over the Files, the last Chunk of each File is partially used
+    fat_values = [0] * fat_count
+    chunks_all = []
+    file_chunks = max(dat_chunks // max(file_count, 1) - 1, 1)
+
+    for file_index in range(min(file_count, dat_chunks // (file_chunks + 1))) :
+        fat_first = mfs_file_recs + len(chunks_all)
+        fat_values[file_index] = fat_first
+
+        for chunk_index in range(file_chunks) :
+            chunks_all.append(synth_data(rng, mfs_chunk_size))
+            fat_values[fat_first + chunk_index] = fat_first + chunk_index + 1 if chunk_index < file_chunks - 1 else rng.randrange(1, mfs_chunk_size + 1)
+
+    chunks_all += [b'\xFF' * mfs_chunk_size] * (dat_chunks - len(chunks_all))
+
+    # FTBL/EFST Dictionary 0x1, Platform 0x0 & Reserved 0x0 mark a Volume without FTBL/EFST, no FileTable.dat lookup (not shipped)
+    vol_data = struct_bytes(mea.MFS_Volume_Header, Signature=0x724F6201, FTBLDictionary=0x1, FTBLPlatform=0x0, FTBLReserved=0,
+                            VolumeSize=(sys_chunks + dat_chunks) * mfs_chunk_size, FileRecordCount=mfs_file_recs)
+    sys_data = vol_data + b''.join(value.to_bytes(2, 'little') for value in fat_values)
+    sys_data += b'\x00' * (sys_chunks * mfs_chunk_size - len(sys_data))
+    sys_all = [(index, sys_data[index * mfs_chunk_size:(index + 1) * mfs_chunk_size]) for index in range(sys_chunks)]
+
+    pages = [mfs_sys_page(page + 1, sys_all[page * mfs_chunks_sys:(page + 1) * mfs_chunks_sys]) for page in range(sys_count)]
+    pages += [mfs_dat_page(sys_count + page + 1, sys_chunks + page * mfs_chunks_dat, chunks_all[page * mfs_chunks_dat:(page + 1) * mfs_chunks_dat])
+              for page in range(dat_count)]
+
+    scratch_hdr = bytearray(mfs_page_hdr(page_count, 0))
+    scratch_hdr[:4] = b'\xFF' * 4 # Scratch Page has no Signature, its CRC-8 includes it
+
+    pages.append(bytes(scratch_hdr) + b'\xFF' * (mfs_page_size - len(scratch_hdr)))
+
+    return b''.join(pages)
+
+# Build $FPT Data Partition with its Entries (offsets relative to $FPT)
+def fpt_data(fpt_parts) :
+    fpt_hdr_size = ctypes.sizeof(mea.FPT_Header_21)
+    fpt_entry_size = ctypes.sizeof(mea.FPT_Entry)
+
+    data_off = 0x1000
+    entry_data = b''
+    part_data = b''
+
+    for part_name, part_type, part_bytes in fpt_parts :
+        entry_data += struct_bytes(mea.FPT_Entry, Name=part_name.encode('utf-8'), Offset=data_off, Size=len(part_bytes), Flags=part_type)
+        part_data += part_bytes
+        data_off += len(part_bytes)
+
+    fpt_hdr = bytearray(struct_bytes(mea.FPT_Header_21, Tag=b'$FPT', NumPartitions=len(fpt_parts), HeaderVersion=0x21, EntryVersion=0x10,
+                        HeaderLength=fpt_hdr_size, FitMajor=synth_ver[0], FitMinor=synth_ver[1], FitHotfix=synth_ver[2], FitBuild=synth_ver[3]))
+    fpt_hdr[0x14:0x18] = mea.crccheck.crc.Crc32.calc(fpt_hdr + entry_data).to_bytes(4, 'little')
+
+    fpt_all = fpt_hdr + entry_data
+
+    return bytes(fpt_all + b'\xFF' * (0x1000 - len(fpt_all)) + part_data)
+
+# Build Boot Partition with BPDT & its Code Partitions (offsets relative to BPDT)
+def bpdt_boot(bpdt_parts) :
+    bpdt_hdr_size = ctypes.sizeof(mea.BPDT_Header_2)
+    bpdt_entry_size = ctypes.sizeof(mea.BPDT_Entry)
+
+    # IFWI 1.7 BPDT has at least 6 Entries, pad with empty SMIP, UCOD, IBBP & OBBP
+    bpdt_parts = bpdt_parts + [(part_type, b'') for part_type in (0, 3, 4, 6)][:max(6 - len(bpdt_parts), 0)]
+
+    data_off = 0x1000
+    entry_data = b''
+    part_data = b''
+
+    for part_type, part_bytes in bpdt_parts :
+        entry_data += struct_bytes(mea.BPDT_Entry, Type=part_type, Offset=data_off if part_bytes else 0, Size=len(part_bytes))
+        part_data += part_bytes
+        data_off += len(part_bytes)
+
+    bpdt_hdr = bytearray(struct_bytes(mea.BPDT_Header_2, Signature=0x55AA, DescCount=len(bpdt_parts), BPDTVersion=2, BPDTConfig=0,
+                         IFWIVersion=0, FitMajor=synth_ver[0], FitMinor=synth_ver[1], FitHotfix=synth_ver[2], FitBuild=synth_ver[3]))
+    bpdt_hdr[0x8:0xC] = mea.crccheck.crc.Crc32.calc(bpdt_hdr[0x4:] + entry_data).to_bytes(4, 'little')
+
+    bpdt_all = bpdt_hdr + entry_data
+
+    return bytes(bpdt_all + b'\xFF' * (0x1000 - len(bpdt_all)) + part_data)
+
+# Build CSE Layout Table 1.7 with Data & Boot 1 Partitions
+def cse_lt(data_size, bp1_size) :
+    cse_lt_hdr = bytearray(struct_bytes(mea.CSE_Layout_Table_17, Size=0x40, Flags=0, DataOffset=0x1000, DataSize=data_size,
+                           BP1Offset=0x1000 + data_size, BP1Size=bp1_size))
+    cse_lt_hdr[0x14:0x18] = mea.crccheck.crc.Crc32.calc(cse_lt_hdr[0x10:0x14] + b'\x00' * 4 + cse_lt_hdr[0x18:0x50]).to_bytes(4, 'little')
+
+    return bytes(cse_lt_hdr + b'\xFF' * (0x1000 - len(cse_lt_hdr)))
+
+# Build deterministic synthetic CSME IFWI 1.7 image
+def synth_image(seed, image_size, part_count, mod_count, mfs_size, mfs_files, compress=True) :
+    rng = random.Random(seed)
+    key = rsa_key(rng)
+
+    part_count = min(max(part_count, 1), len(synth_parts) + 1)
+    mod_names = synth_ftpr_mods + ['mod%0.3d' % index for index in range(max(mod_count - len(synth_ftpr_mods), 0))]
+
+    # Module sizes fill about half of the image, the rest is MFS and padding
+    mod_size = max((image_size - mfs_size) // 2 // (max(mod_count, len(synth_ftpr_mods)) * part_count), 0x400)
+
+    bpdt_parts = [(2, cpd_partition('FTPR', mod_names, mod_size, key, rng, compress))]
+    for part_type, part_name in synth_parts[:part_count - 1] :
+        bpdt_parts.append((part_type, cpd_partition(part_name, ['%s%0.2d' % (part_name.lower(), index) for index in range(mod_count)],
+                                                    mod_size, key, rng, compress)))
+
+    data_part = fpt_data([('MFS', 1, mfs_partition(mfs_size, mfs_files, rng))])
+    boot_part = bpdt_boot(bpdt_parts)
+
+    image = cse_lt(len(data_part), len(boot_part)) + data_part + boot_part
+
+    if len(image) > image_size : sys.exit('Error: Image size 0x%X is too small, need at least 0x%X!' % (image_size, align_up(len(image), 0x1000)))
+
+    return image + b'\xFF' * (image_size - len(image))
+
+def main() :
+    parser = argparse.ArgumentParser(description='ME Analyzer Synthetic Firmware Generator')
+    parser.add_argument('output', help='output image file, or directory when --count > 1')
+    parser.add_argument('--size', type=lambda x: int(x, 0), default=0x800000, help='image size (default: 0x800000)')
+    parser.add_argument('--partitions', type=int, default=3, help='Code Partitions count, FTPR included (default: %%(default)s, max %d)' % (len(synth_parts) + 1))
+    parser.add_argument('--modules', type=int, default=16, help='Modules per Code Partition (default: %(default)s)')
+    parser.add_argument('--mfs-size', type=lambda x: int(x, 0), default=0x40000, help='MFS partition size (default: 0x40000)')
+    parser.add_argument('--mfs-files', type=int, default=32, help='MFS files count (default: %(default)s)')
+    parser.add_argument('--no-compress', action='store_true', help='store all Modules uncompressed')
+    parser.add_argument('--seed', type=int, default=0, help='random seed, same seed gives same image (default: %(default)s)')
+    parser.add_argument('--count', type=int, default=1, help='images to generate, seeds seed to seed + count - 1 (default: %(default)s)')
+    args = parser.parse_args()
+
+    if args.mfs_size % mfs_page_size or args.mfs_size < mfs_page_size * 12 :
+        parser.error('MFS size must be a multiple of 0x%X and at least 0x%X' % (mfs_page_size, mfs_page_size * 12))
+
+    if args.count > 1 : os.makedirs(args.output, exist_ok=True)
+
+    for seed in range(args.seed, args.seed + args.count) :
+        image = synth_image(seed, args.size, args.partitions, args.modules, args.mfs_size, args.mfs_files, not args.no_compress)
+
+        out_path = os.path.join(args.output, 'synth_%0.4d.bin' % seed) if args.count > 1 else args.output
+
+        with open(out_path, 'wb') as out_file : out_file.write(image)
+
+        print('%s: 0x%X bytes, seed %d' % (out_path, len(image), seed))
+
+    return 0
+
+if __name__ == '__main__' :
+    sys.exit(main())